@@ -2,53 +2,185 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
-from urllib.parse import urljoin
+import random
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
-from pydantic import BaseModel
+import orjson
+
+from .cache import TTLCache, cached
+from .circuit import get_breaker
 
 logger = logging.getLogger(__name__)
 
+# Status codes that indicate a transient bridge condition worth retrying
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+# Statuses and errors that mean the bridge did not run the request, so even
+# non-idempotent actions (e.g. TogglePower) can be safely resent
+UNPROCESSED_STATUS_CODES = frozenset({429, 503})
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Upper bound for a single backoff delay in seconds
+RETRY_BACKOFF_CAP = 30.0
+
+# How long static bridge and device metadata is cached, in seconds
+METADATA_CACHE_TTL = 300.0
+
+# Caches for static bridge and device metadata
+_bridge_info_cache = TTLCache(METADATA_CACHE_TTL)
+_device_list_cache = TTLCache(METADATA_CACHE_TTL)
+_device_info_cache = TTLCache(METADATA_CACHE_TTL)
+
+
+@lru_cache(maxsize=1024)
+def _action_endpoint(device_id: str, action: str) -> str:
+    """Build the API endpoint for a device action, memoized per (device, action)."""
+    return f"devices/{device_id}/actions/{action}"
+
 
 class BondAPIError(Exception):
     """Exception raised for Bond API errors."""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        """Initialize Bond API error.
+        
+        Args:
+            message: Error description
+            status_code: HTTP status returned by the bridge, if any
+        """
+        super().__init__(message)
+        self.status_code = status_code
+
+
+# Shared HTTP clients reused across Bond API calls, keyed by (host, token, timeout)
+_clients: Dict[Tuple[str, str, float], httpx.AsyncClient] = {}
+_clients_lock = asyncio.Lock()
+
+
+async def get_shared_client(host: str, token: str, timeout: float = 10.0) -> httpx.AsyncClient:
+    """Get the shared HTTP client for a bridge, creating it on first use.
+    
+    Args:
+        host: Bond Bridge IP address or hostname
+        token: Bond API token
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Shared httpx client with keep-alive connections to the bridge
+    """
+    key = (host, token, timeout)
+    client = _clients.get(key)
+    if client is None:
+        async with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                client = httpx.AsyncClient(
+                    headers={
+                        "Bond-Token": token,  # Bond uses custom header
+                        "Content-Type": "application/json"
+                    },
+                    timeout=httpx.Timeout(connect=3.0, read=timeout, write=timeout, pool=5.0),
+                    limits=httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=16,
+                        keepalive_expiry=60
+                    ),
+                    http2=False  # Bond Bridge local API only speaks HTTP/1.1
+                )
+                _clients[key] = client
+    return client
+
+
+# Per-host limits on concurrent in-flight requests to the bridge
+_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+
+def get_semaphore(host: str, max_concurrency: int = 8) -> asyncio.Semaphore:
+    """Get the concurrency-limiting semaphore for a host, creating it on first use.
+    
+    Args:
+        host: Bond Bridge IP address or hostname
+        max_concurrency: Maximum number of in-flight requests to the host
+        
+    Returns:
+        Semaphore shared by all clients of the host
+    """
+    semaphore = _semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+        _semaphores[host] = semaphore
+    return semaphore
+
+
+async def close_shared_client() -> None:
+    """Close all shared HTTP clients that have been created."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
 
 
 class BondClient:
     """Async client for Bond Bridge Local API."""
     
-    def __init__(self, host: str, token: str, timeout: float = 10.0):
+    __slots__ = (
+        'host',
+        'token',
+        'timeout',
+        'max_retries',
+        'retry_delay',
+        'base_url',
+        '_breaker',
+        '_sem'
+    )
+    
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        timeout: float = 10.0,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        max_concurrency: int = 8
+    ):
         """Initialize Bond client.
         
         Args:
             host: Bond Bridge IP address or hostname
             token: Bond API token
             timeout: Request timeout in seconds
+            max_retries: Maximum number of retries for transient failures
+            retry_delay: Base delay in seconds for exponential backoff
+            failure_threshold: Consecutive failures before the circuit breaker opens
+            recovery_timeout: Seconds the circuit stays open before a trial request
+            max_concurrency: Maximum number of in-flight requests to the bridge
         """
         self.host = host.rstrip('/')
         self.token = token
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
         self.base_url = f"http://{self.host}/v2/"
-        
-        self._client: Optional[httpx.AsyncClient] = None
+        self._breaker = get_breaker(self.host, failure_threshold, recovery_timeout)
+        self._sem = get_semaphore(self.host, max_concurrency)
     
-    async def __aenter__(self):
-        """Async context manager entry."""
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout,
-            headers={
-                "Bond-Token": self.token,  # Bond uses custom header
-                "Content-Type": "application/json"
-            }
+    async def _backoff(self, attempt: int, reason: str) -> None:
+        """Sleep before a retry using exponential backoff with full jitter.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            reason: Short description of the failure for logging
+        """
+        delay = random.uniform(0, min(RETRY_BACKOFF_CAP, self.retry_delay * 2 ** attempt))
+        logger.warning(
+            f"Bond API request failed ({reason}), retrying in {delay:.2f}s "
+            f"(attempt {attempt + 1}/{self.max_retries})"
         )
-        return self
-    
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        if self._client:
-            await self._client.aclose()
+        await asyncio.sleep(delay)
     
     async def _request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """Make HTTP request to Bond API.
@@ -64,47 +196,83 @@ class BondClient:
         Raises:
             BondAPIError: If API request fails
         """
-        if not self._client:
-            raise BondAPIError("Client not initialized. Use async context manager.")
+        if not self._breaker.allow_request():
+            raise BondAPIError(f"Circuit open: Bond Bridge at {self.host} is unavailable")
         
-        url = urljoin(self.base_url, endpoint)
+        client = await get_shared_client(self.host, self.token, self.timeout)
+        url = self.base_url + endpoint
         
         # Debug logging
-        logger.debug(f"Making {method} request to: {url}")
-        logger.debug(f"Headers: {self._client.headers}")
+        logger.debug("Making %s request to: %s", method, url)
+        logger.debug("Headers: %s", client.headers)
         
-        try:
-            response = await self._client.request(method, url, **kwargs)
-            
-            # Debug response
-            logger.debug(f"Response status: {response.status_code}")
-            logger.debug(f"Response headers: {response.headers}")
-            logger.debug(f"Response text: {response.text}")
-            
-            response.raise_for_status()
-            
-            if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
-            return {"status": "success"}
-            
-        except httpx.HTTPStatusError as e:
-            error_msg = f"Bond API error {e.response.status_code}: {e.response.text}"
-            logger.error(f"Full request details - URL: {url}, Headers: {self._client.headers}")
-            logger.error(error_msg)
-            raise BondAPIError(error_msg) from e
-        except httpx.RequestError as e:
-            error_msg = f"Bond API request failed: {str(e)}"
-            logger.error(error_msg)
-            raise BondAPIError(error_msg) from e
+        # Actions may already have run on the bridge when a response is lost
+        idempotent = method == "GET"
+        retryable_statuses = RETRYABLE_STATUS_CODES if idempotent else UNPROCESSED_STATUS_CODES
+        
+        attempt = 0
+        while True:
+            # Stop retrying once the circuit has opened, e.g. due to another caller
+            if attempt and not self._breaker.allow_retry():
+                self._breaker.on_failure()
+                raise BondAPIError(f"Circuit open: Bond Bridge at {self.host} is unavailable")
+            try:
+                # Bound concurrent requests so bursts queue here instead of overloading the bridge
+                async with self._sem:
+                    response = await client.request(method, url, **kwargs)
+                
+                # Debug response
+                logger.debug("Response status: %s", response.status_code)
+                logger.debug("Response headers: %s", response.headers)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response text: %s", response.text)
+                
+                response.raise_for_status()
+                self._breaker.on_success()
+                
+                # Bond responses are either JSON or empty
+                try:
+                    return orjson.loads(response.content)
+                except ValueError:
+                    return {"status": "success"}
+                
+            except httpx.HTTPStatusError as e:
+                status_code = e.response.status_code
+                # Only transient statuses are retried; auth and validation errors fail immediately
+                if status_code in retryable_statuses and attempt < self.max_retries:
+                    await self._backoff(attempt, f"HTTP {status_code}")
+                    attempt += 1
+                    continue
+                if status_code >= 500:
+                    self._breaker.on_failure()
+                else:
+                    self._breaker.on_success()
+                error_msg = f"Bond API error {status_code}: {e.response.text}"
+                logger.error(f"Full request details - URL: {url}, Headers: {client.headers}")
+                logger.error(error_msg)
+                raise BondAPIError(error_msg, status_code) from e
+            except httpx.RequestError as e:
+                retryable = idempotent or isinstance(e, UNSENT_REQUEST_ERRORS)
+                if retryable and attempt < self.max_retries:
+                    await self._backoff(attempt, type(e).__name__)
+                    attempt += 1
+                    continue
+                self._breaker.on_failure()
+                error_msg = f"Bond API request failed: {str(e)}"
+                logger.error(error_msg)
+                raise BondAPIError(error_msg) from e
     
+    @cached(_bridge_info_cache)
     async def get_bridge_info(self) -> Dict[str, Any]:
         """Get Bond Bridge information."""
         return await self._request("GET", "")
     
+    @cached(_device_list_cache)
     async def list_devices(self) -> Dict[str, Any]:
         """List all devices connected to the Bond Bridge."""
         return await self._request("GET", "devices")
     
+    @cached(_device_info_cache)
     async def get_device_info(self, device_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific device.
         
@@ -138,10 +306,14 @@ class BondClient:
         Returns:
             Action response
         """
-        endpoint = f"devices/{device_id}/actions/{action}"
+        endpoint = _action_endpoint(device_id, action)
         data = {"argument": argument} if argument is not None else {}
         
-        return await self._request("PUT", endpoint, json=data)
+        # Content-Type is already set on the shared client
+        result = await self._request("PUT", endpoint, content=orjson.dumps(data))
+        # Device metadata may reflect the action, so drop any cached copy
+        _device_info_cache.invalidate((self.host, device_id))
+        return result
     
     # Convenience methods for common actions
     
@@ -153,6 +325,13 @@ class BondClient:
         """Turn off a device."""
         return await self.send_action(device_id, "TurnOff")
     
+    async def toggle_power(self, device_id: str) -> Dict[str, Any]:
+        """Toggle device power on the bridge.
+        
+        Only retried when the bridge cannot have run it, so it never toggles twice.
+        """
+        return await self.send_action(device_id, "TogglePower")
+    
     async def set_speed(self, device_id: str, speed: int) -> Dict[str, Any]:
         """Set fan speed (1-8, or 0 for off).
         
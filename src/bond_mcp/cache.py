@@ -0,0 +1,77 @@
+"""In-process TTL cache for static Bond Bridge metadata."""
+
+import copy
+import functools
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar, cast
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+class TTLCache:
+    """Simple key/value cache whose entries expire after a fixed time-to-live."""
+
+    def __init__(self, ttl: float):
+        """Initialize cache.
+
+        Args:
+            ttl: Time-to-live for entries in seconds
+        """
+        self.ttl = ttl
+        self._store: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value for the configured TTL."""
+        self._store[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        self._store.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._store.clear()
+
+
+def cached(cache: TTLCache) -> Callable[[F], F]:
+    """Cache results of an async client method in the given cache.
+
+    Keys are the client host followed by the call's argument values in the
+    order given, so callers can invalidate entries through the same cache
+    object. Callers receive a shallow copy of the cached value; nested values
+    are shared and must be treated as read-only.
+
+    Args:
+        cache: Cache that stores the method's results
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            key = (self.host, *args, *kwargs.values())
+            value = cache.get(key)
+            if value is None:
+                value = await func(self, *args, **kwargs)
+                cache.set(key, value)
+            return copy.copy(value)
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -0,0 +1,106 @@
+"""Circuit breaker for failing fast when the Bond Bridge is unreachable."""
+
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"  # Requests flow normally
+    OPEN = "open"  # Requests are rejected without contacting the bridge
+    HALF_OPEN = "half_open"  # A single trial request is in flight
+
+
+@dataclass
+class CircuitBreaker:
+    """Tracks consecutive failures for a host and short-circuits calls while it is down."""
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    state: CircuitState = CircuitState.CLOSED
+    failure_count: int = 0
+    opened_at: float = 0.0
+    trial_in_flight: bool = False
+    trial_started_at: float = 0.0
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent.
+
+        After the recovery timeout a single trial request is let through; other
+        callers are rejected until it reports back. A trial that never reports
+        back expires after another recovery timeout.
+
+        Returns:
+            False while the circuit is open or a trial request is pending
+        """
+        if self.state == CircuitState.CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == CircuitState.HALF_OPEN:
+            if self.trial_in_flight and now - self.trial_started_at < self.recovery_timeout:
+                return False
+        elif now - self.opened_at < self.recovery_timeout:
+            return False
+        self.state = CircuitState.HALF_OPEN
+        self.trial_in_flight = True
+        self.trial_started_at = now
+        return True
+
+    def allow_retry(self) -> bool:
+        """Check whether a failed request may be retried.
+
+        Retries are only sent while the circuit is closed; a failed trial
+        request is not retried.
+        """
+        return self.state == CircuitState.CLOSED
+
+    def on_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        self.state = CircuitState.CLOSED
+        self.failure_count = 0
+        self.trial_in_flight = False
+
+    def on_failure(self) -> None:
+        """Record a failed call and open the circuit once the threshold is reached."""
+        self.failure_count += 1
+        if self.state == CircuitState.OPEN:
+            # Late failures from calls started before opening do not extend the window
+            return
+        if self.state == CircuitState.HALF_OPEN or self.failure_count >= self.failure_threshold:
+            logger.warning(f"Circuit opened after {self.failure_count} consecutive failures")
+            self.state = CircuitState.OPEN
+            self.opened_at = time.monotonic()
+            self.trial_in_flight = False
+
+
+# One breaker per Bond Bridge host
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(
+    host: str,
+    failure_threshold: int = 5,
+    recovery_timeout: float = 30.0
+) -> CircuitBreaker:
+    """Get the circuit breaker for a host, creating it on first use.
+
+    Args:
+        host: Bond Bridge IP address or hostname
+        failure_threshold: Consecutive failures before the circuit opens
+        recovery_timeout: Seconds to wait before allowing a trial request
+
+    Returns:
+        Circuit breaker shared by all clients of the host
+    """
+    breaker = _breakers.get(host)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            failure_threshold=failure_threshold,
+            recovery_timeout=recovery_timeout
+        )
+        _breakers[host] = breaker
+    return breaker
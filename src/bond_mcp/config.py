@@ -1,9 +1,8 @@
 """Configuration management for Bond MCP Server."""
 
-import os
 from typing import Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,6 +17,18 @@ class BondConfig(BaseSettings):
     timeout: float = Field(default=10.0, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum number of API retries")
     retry_delay: float = Field(default=1.0, description="Delay between retries in seconds")
+    max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of concurrent requests to the Bond Bridge"
+    )
+    circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive failures before the circuit breaker opens"
+    )
+    circuit_recovery_timeout: float = Field(
+        default=30.0,
+        description="Seconds the circuit breaker stays open before a trial request"
+    )
     
     # Logging settings
     log_level: str = Field(default="INFO", description="Logging level")
@@ -37,52 +48,41 @@ class BondConfig(BaseSettings):
         extra="ignore"
     )
     
-    @field_validator('bond_host')
-    @classmethod
-    def validate_host(cls, v):
-        """Validate Bond host format."""
-        if not v:
+    @model_validator(mode='after')
+    def _validate(self) -> "BondConfig":
+        """Validate configuration values and normalize host and log level."""
+        host = self.bond_host
+        if not host:
             raise ValueError("Bond host cannot be empty")
         # Remove protocol if present
-        if v.startswith(('http://', 'https://')):
-            v = v.split('://', 1)[1]
+        if host.startswith(('http://', 'https://')):
+            host = host.split('://', 1)[1]
         # Remove trailing slash
-        return v.rstrip('/')
-    
-    @field_validator('bond_token')
-    @classmethod
-    def validate_token(cls, v):
-        """Validate Bond token format."""
-        if not v:
+        self.bond_host = host.rstrip('/')
+        
+        if not self.bond_token:
             raise ValueError("Bond token cannot be empty")
-        if len(v) < 10:
+        if len(self.bond_token) < 10:
             raise ValueError("Bond token appears to be too short")
-        return v
-    
-    @field_validator('timeout')
-    @classmethod
-    def validate_timeout(cls, v):
-        """Validate timeout value."""
-        if v <= 0:
+        
+        if self.timeout <= 0:
             raise ValueError("Timeout must be positive")
-        return v
-    
-    @field_validator('max_retries')
-    @classmethod
-    def validate_max_retries(cls, v):
-        """Validate max retries value."""
-        if v < 0:
+        if self.max_retries < 0:
             raise ValueError("Max retries cannot be negative")
-        return v
-    
-    @field_validator('log_level')
-    @classmethod
-    def validate_log_level(cls, v):
-        """Validate log level."""
+        if self.max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1")
+        if self.circuit_failure_threshold < 1:
+            raise ValueError("Circuit failure threshold must be at least 1")
+        if self.circuit_recovery_timeout <= 0:
+            raise ValueError("Circuit recovery timeout must be positive")
+        
         valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if v.upper() not in valid_levels:
+        log_level = self.log_level.upper()
+        if log_level not in valid_levels:
             raise ValueError(f"Log level must be one of: {', '.join(valid_levels)}")
-        return v.upper()
+        self.log_level = log_level
+        
+        return self
 
 
 def get_config() -> BondConfig:
@@ -1,9 +1,9 @@
 """Pydantic models for Bond API data structures."""
 
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class DeviceType(str, Enum):
@@ -36,6 +36,19 @@ class ActionType(str, Enum):
     PRESET = "Preset"
 
 
+# Valid (min, max) argument range for actions that take a numeric argument
+_ARG_RANGES: Dict[ActionType, Tuple[int, int]] = {
+    ActionType.SET_SPEED: (0, 8),
+    ActionType.SET_BRIGHTNESS: (0, 100),
+    ActionType.SET_POSITION: (0, 100),
+    ActionType.INCREASE_BRIGHTNESS: (0, 100),
+    ActionType.DECREASE_BRIGHTNESS: (0, 100),
+}
+
+# Actions whose argument is a direction (1 = forward, -1 = reverse)
+_DIRECTION_ACTIONS = frozenset({ActionType.SET_DIRECTION})
+
+
 class DeviceInfo(BaseModel):
     """Device information model."""
     name: str
@@ -45,8 +58,7 @@ class DeviceInfo(BaseModel):
     properties: Dict[str, Any] = Field(default_factory=dict)
     state: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class DeviceState(BaseModel):
@@ -58,19 +70,22 @@ class DeviceState(BaseModel):
     position: Optional[int] = None  # Shade position (0-100)
     timer: Optional[int] = None  # Timer in seconds
     
-    @validator('speed')
+    @field_validator('speed')
+    @classmethod
     def validate_speed(cls, v):
         if v is not None and not (0 <= v <= 8):
             raise ValueError('Speed must be between 0 and 8')
         return v
     
-    @validator('brightness', 'position')
+    @field_validator('brightness', 'position')
+    @classmethod
     def validate_percentage(cls, v):
         if v is not None and not (0 <= v <= 100):
             raise ValueError('Value must be between 0 and 100')
         return v
     
-    @validator('direction')
+    @field_validator('direction')
+    @classmethod
     def validate_direction(cls, v):
         if v is not None and v not in [-1, 1]:
             raise ValueError('Direction must be -1 (reverse) or 1 (forward)')
@@ -96,19 +111,19 @@ class ActionRequest(BaseModel):
     action: ActionType
     argument: Optional[int] = None
     
-    @validator('argument')
-    def validate_argument(cls, v, values):
-        action = values.get('action')
-        if action == ActionType.SET_SPEED and v is not None:
-            if not (0 <= v <= 8):
-                raise ValueError('Speed must be between 0 and 8')
-        elif action in [ActionType.SET_BRIGHTNESS, ActionType.SET_POSITION] and v is not None:
-            if not (0 <= v <= 100):
-                raise ValueError('Brightness and position must be between 0 and 100')
-        elif action == ActionType.SET_DIRECTION and v is not None:
-            if v not in [-1, 1]:
-                raise ValueError('Direction must be -1 or 1')
-        return v
+    model_config = ConfigDict(frozen=True)
+    
+    @model_validator(mode='after')
+    def validate_argument(self) -> "ActionRequest":
+        v = self.argument
+        if v is None:
+            return self
+        rng = _ARG_RANGES.get(self.action)
+        if rng is not None and not (rng[0] <= v <= rng[1]):
+            raise ValueError(f'{self.action.value} argument must be between {rng[0]} and {rng[1]}')
+        if self.action in _DIRECTION_ACTIONS and v not in (-1, 1):
+            raise ValueError('Direction must be -1 or 1')
+        return self
 
 
 class DeviceListResponse(BaseModel):
@@ -131,6 +146,8 @@ class GroupInfo(BaseModel):
     name: str
     devices: List[str] = Field(default_factory=list)
     location: Optional[str] = None
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ScheduleInfo(BaseModel):
@@ -142,10 +159,14 @@ class ScheduleInfo(BaseModel):
     days: List[int] = Field(default_factory=list)  # 0=Sunday, 1=Monday, etc.
     time: str  # HH:MM format
     enabled: bool = True
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class ErrorResponse(BaseModel):
     """Error response model."""
     error: str
     code: Optional[int] = None
-    details: Optional[str] = None
\ No newline at end of file
+    details: Optional[str] = None
+    
+    model_config = ConfigDict(frozen=True)
\ No newline at end of file
@@ -2,22 +2,13 @@
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
 
-import fastmcp
 from fastmcp import FastMCP
 
-from .bond_client import BondClient, BondAPIError
-from .config import get_config, validate_config
-from .models import (
-    ActionRequest,
-    ActionType,
-    DeviceInfo,
-    DeviceListResponse,
-    DeviceState,
-    DeviceType,
-    ErrorResponse
-)
+from .bond_client import BondClient, BondAPIError, close_shared_client
+from .config import validate_config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,16 +16,45 @@ logger = logging.getLogger(__name__)
 
 # Global configuration and client
 config = validate_config()
-mcp = FastMCP(config.server_name)
 
 
-async def get_bond_client() -> BondClient:
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared Bond HTTP client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await close_shared_client()
+
+
+mcp = FastMCP(config.server_name, lifespan=lifespan)
+
+# Status the bridge returns for an action the device does not support
+UNSUPPORTED_ACTION_STATUS = 404
+
+# Fan direction names mapped to Bond direction values
+_DIRECTION_MAP = {"forward": 1, "reverse": -1}
+
+# Supported shade actions, in the order shown in error messages
+_SHADE_ACTIONS = ("open", "close", "set_position")
+
+
+# Shared Bond client used by all tools
+_SHARED_BOND_CLIENT = BondClient(
+    host=config.bond_host,
+    token=config.bond_token,
+    timeout=config.timeout,
+    max_retries=config.max_retries,
+    retry_delay=config.retry_delay,
+    failure_threshold=config.circuit_failure_threshold,
+    recovery_timeout=config.circuit_recovery_timeout,
+    max_concurrency=config.max_concurrency
+)
+
+
+def get_bond_client() -> BondClient:
     """Get configured Bond client."""
-    return BondClient(
-        host=config.bond_host,
-        token=config.bond_token,
-        timeout=config.timeout
-    )
+    return _SHARED_BOND_CLIENT
 
 
 @mcp.tool()
@@ -45,24 +65,24 @@ async def list_devices() -> Dict[str, Any]:
         Dictionary containing all devices with their basic information.
     """
     try:
-        async with await get_bond_client() as client:
-            devices_data = await client.list_devices()
-            
-            # Transform the data for better readability
-            devices = {}
-            for device_id, device_info in devices_data.items():
-                if not device_id.startswith('_'):  # Skip metadata
-                    devices[device_id] = {
-                        "id": device_id,
-                        "name": device_info.get("name", "Unknown"),
-                        "type": device_info.get("type", "Unknown"),
-                        "location": device_info.get("location", "")
-                    }
-            
-            return {
-                "devices": devices,
-                "total_count": len(devices)
-            }
+        client = get_bond_client()
+        devices_data = await client.list_devices()
+        
+        # Transform the data for better readability
+        devices = {}
+        for device_id, device_info in devices_data.items():
+            if not device_id.startswith('_'):  # Skip metadata
+                devices[device_id] = {
+                    "id": device_id,
+                    "name": device_info.get("name", "Unknown"),
+                    "type": device_info.get("type", "Unknown"),
+                    "location": device_info.get("location", "")
+                }
+        
+        return {
+            "devices": devices,
+            "total_count": len(devices)
+        }
     except BondAPIError as e:
         return {"error": f"Failed to list devices: {str(e)}"}
     except Exception as e:
@@ -70,6 +90,42 @@ async def list_devices() -> Dict[str, Any]:
         return {"error": f"Unexpected error: {str(e)}"}
 
 
+@mcp.tool()
+async def list_devices_detailed() -> Dict[str, Any]:
+    """List all Bond devices with their detailed information.
+    
+    Returns:
+        Dictionary containing every device's full information, fetched concurrently.
+    """
+    try:
+        client = get_bond_client()
+        devices_data = await client.list_devices()
+        device_ids = [device_id for device_id in devices_data if not device_id.startswith('_')]
+        
+        # Fetch all device details concurrently; the client bounds in-flight requests
+        infos = await asyncio.gather(
+            *[client.get_device_info(device_id) for device_id in device_ids],
+            return_exceptions=True
+        )
+        
+        devices = {}
+        for device_id, info in zip(device_ids, infos, strict=True):
+            if isinstance(info, BaseException):
+                devices[device_id] = {"id": device_id, "error": str(info)}
+            else:
+                devices[device_id] = {"id": device_id, "info": info}
+        
+        return {
+            "devices": devices,
+            "total_count": len(devices)
+        }
+    except BondAPIError as e:
+        return {"error": f"Failed to list device details: {str(e)}"}
+    except Exception as e:
+        logger.error(f"Unexpected error listing device details: {e}")
+        return {"error": f"Unexpected error: {str(e)}"}
+
+
 @mcp.tool()
 async def get_device_info(device_id: str) -> Dict[str, Any]:
     """Get detailed information about a specific device.
@@ -81,12 +137,12 @@ async def get_device_info(device_id: str) -> Dict[str, Any]:
         Detailed device information including capabilities and properties.
     """
     try:
-        async with await get_bond_client() as client:
-            device_info = await client.get_device_info(device_id)
-            return {
-                "device_id": device_id,
-                "info": device_info
-            }
+        client = get_bond_client()
+        device_info = await client.get_device_info(device_id)
+        return {
+            "device_id": device_id,
+            "info": device_info
+        }
     except BondAPIError as e:
         return {"error": f"Failed to get device info: {str(e)}"}
     except Exception as e:
@@ -105,12 +161,12 @@ async def get_device_state(device_id: str) -> Dict[str, Any]:
         Current device state including power, speed, direction, etc.
     """
     try:
-        async with await get_bond_client() as client:
-            state = await client.get_device_state(device_id)
-            return {
-                "device_id": device_id,
-                "state": state
-            }
+        client = get_bond_client()
+        state = await client.get_device_state(device_id)
+        return {
+            "device_id": device_id,
+            "state": state
+        }
     except BondAPIError as e:
         return {"error": f"Failed to get device state: {str(e)}"}
     except Exception as e:
@@ -129,8 +185,14 @@ async def toggle_device_power(device_id: str) -> Dict[str, Any]:
         Result of the toggle operation.
     """
     try:
-        async with await get_bond_client() as client:
-            # Get current state to determine action
+        client = get_bond_client()
+        try:
+            result = await client.toggle_power(device_id)
+            action = "toggled"
+        except BondAPIError as e:
+            # Fall back to state lookup for devices without TogglePower support
+            if e.status_code != UNSUPPORTED_ACTION_STATUS:
+                raise
             current_state = await client.get_device_state(device_id)
             power = current_state.get("power", 0)
             
@@ -140,12 +202,12 @@ async def toggle_device_power(device_id: str) -> Dict[str, Any]:
             else:
                 result = await client.turn_on(device_id)
                 action = "turned on"
-            
-            return {
-                "device_id": device_id,
-                "action": action,
-                "result": result
-            }
+        
+        return {
+            "device_id": device_id,
+            "action": action,
+            "result": result
+        }
     except BondAPIError as e:
         return {"error": f"Failed to toggle device power: {str(e)}"}
     except Exception as e:
@@ -168,14 +230,14 @@ async def set_fan_speed(device_id: str, speed: int) -> Dict[str, Any]:
         return {"error": "Fan speed must be between 0 and 8"}
     
     try:
-        async with await get_bond_client() as client:
-            result = await client.set_speed(device_id, speed)
-            return {
-                "device_id": device_id,
-                "speed": speed,
-                "action": "off" if speed == 0 else f"set to speed {speed}",
-                "result": result
-            }
+        client = get_bond_client()
+        result = await client.set_speed(device_id, speed)
+        return {
+            "device_id": device_id,
+            "speed": speed,
+            "action": "off" if speed == 0 else f"set to speed {speed}",
+            "result": result
+        }
     except BondAPIError as e:
         return {"error": f"Failed to set fan speed: {str(e)}"}
     except Exception as e:
@@ -194,20 +256,19 @@ async def set_fan_direction(device_id: str, direction: str) -> Dict[str, Any]:
     Returns:
         Result of the direction change operation.
     """
-    direction_map = {"forward": 1, "reverse": -1}
-    
-    if direction.lower() not in direction_map:
+    direction_lower = direction.lower()
+    dir_value = _DIRECTION_MAP.get(direction_lower)
+    if dir_value is None:
         return {"error": "Direction must be 'forward' or 'reverse'"}
     
     try:
-        async with await get_bond_client() as client:
-            dir_value = direction_map[direction.lower()]
-            result = await client.set_direction(device_id, dir_value)
-            return {
-                "device_id": device_id,
-                "direction": direction.lower(),
-                "result": result
-            }
+        client = get_bond_client()
+        result = await client.set_direction(device_id, dir_value)
+        return {
+            "device_id": device_id,
+            "direction": direction_lower,
+            "result": result
+        }
     except BondAPIError as e:
         return {"error": f"Failed to set fan direction: {str(e)}"}
     except Exception as e:
@@ -227,28 +288,28 @@ async def control_shades(device_id: str, action: str, position: Optional[int] =
     Returns:
         Result of the shade control operation.
     """
-    valid_actions = ["open", "close", "set_position"]
-    if action.lower() not in valid_actions:
-        return {"error": f"Action must be one of: {', '.join(valid_actions)}"}
+    action_lower = action.lower()
+    if action_lower not in _SHADE_ACTIONS:
+        return {"error": f"Action must be one of: {', '.join(_SHADE_ACTIONS)}"}
     
-    if action.lower() == "set_position" and (position is None or not (0 <= position <= 100)):
+    if action_lower == "set_position" and (position is None or not (0 <= position <= 100)):
         return {"error": "Position must be between 0 and 100 when setting position"}
     
     try:
-        async with await get_bond_client() as client:
-            if action.lower() == "open":
-                result = await client.open_shades(device_id)
-            elif action.lower() == "close":
-                result = await client.close_shades(device_id)
-            else:  # set_position
-                result = await client.set_position(device_id, position)
-            
-            return {
-                "device_id": device_id,
-                "action": action.lower(),
-                "position": position if action.lower() == "set_position" else None,
-                "result": result
-            }
+        client = get_bond_client()
+        if action_lower == "open":
+            result = await client.open_shades(device_id)
+        elif action_lower == "close":
+            result = await client.close_shades(device_id)
+        else:  # set_position
+            result = await client.set_position(device_id, position)
+        
+        return {
+            "device_id": device_id,
+            "action": action_lower,
+            "position": position if action_lower == "set_position" else None,
+            "result": result
+        }
     except BondAPIError as e:
         return {"error": f"Failed to control shades: {str(e)}"}
     except Exception as e:
@@ -271,20 +332,20 @@ async def set_light_brightness(device_id: str, brightness: int) -> Dict[str, Any
         return {"error": "Brightness must be between 0 and 100"}
     
     try:
-        async with await get_bond_client() as client:
-            if brightness == 0:
-                result = await client.turn_off(device_id)
-                action = "turned off"
-            else:
-                result = await client.dim_light(device_id, brightness)
-                action = f"set to {brightness}% brightness"
-            
-            return {
-                "device_id": device_id,
-                "brightness": brightness,
-                "action": action,
-                "result": result
-            }
+        client = get_bond_client()
+        if brightness == 0:
+            result = await client.turn_off(device_id)
+            action = "turned off"
+        else:
+            result = await client.dim_light(device_id, brightness)
+            action = f"set to {brightness}% brightness"
+        
+        return {
+            "device_id": device_id,
+            "brightness": brightness,
+            "action": action,
+            "result": result
+        }
     except BondAPIError as e:
         return {"error": f"Failed to set light brightness: {str(e)}"}
     except Exception as e:
@@ -305,14 +366,14 @@ async def send_custom_action(device_id: str, action: str, argument: Optional[int
         Result of the custom action.
     """
     try:
-        async with await get_bond_client() as client:
-            result = await client.send_action(device_id, action, argument)
-            return {
-                "device_id": device_id,
-                "action": action,
-                "argument": argument,
-                "result": result
-            }
+        client = get_bond_client()
+        result = await client.send_action(device_id, action, argument)
+        return {
+            "device_id": device_id,
+            "action": action,
+            "argument": argument,
+            "result": result
+        }
     except BondAPIError as e:
         return {"error": f"Failed to send custom action: {str(e)}"}
     except Exception as e:
@@ -328,16 +389,16 @@ async def get_bridge_info() -> Dict[str, Any]:
         Bridge information including version, uptime, and configuration.
     """
     try:
-        async with await get_bond_client() as client:
-            bridge_info = await client.get_bridge_info()
-            return {
-                "bridge": bridge_info,
-                "server_config": {
-                    "host": config.bond_host,
-                    "timeout": config.timeout,
-                    "max_retries": config.max_retries
-                }
+        client = get_bond_client()
+        bridge_info = await client.get_bridge_info()
+        return {
+            "bridge": bridge_info,
+            "server_config": {
+                "host": config.bond_host,
+                "timeout": config.timeout,
+                "max_retries": config.max_retries
             }
+        }
     except BondAPIError as e:
         return {"error": f"Failed to get bridge info: {str(e)}"}
     except Exception as e:
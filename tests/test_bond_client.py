@@ -0,0 +1,125 @@
+"""Tests for BondClient retry and circuit breaker behaviour."""
+
+import httpx
+import pytest
+
+from bond_mcp import bond_client, circuit
+from bond_mcp.bond_client import BondAPIError, BondClient
+
+HOST = "bond.test"
+TOKEN = "test-token-1234"
+TIMEOUT = 10.0
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    """Isolate the per-host clients, breakers, semaphores and caches between tests."""
+    monkeypatch.setattr(bond_client, "_clients", {})
+    monkeypatch.setattr(bond_client, "_semaphores", {})
+    monkeypatch.setattr(circuit, "_breakers", {})
+    for cache in (
+        bond_client._bridge_info_cache,
+        bond_client._device_list_cache,
+        bond_client._device_info_cache,
+    ):
+        cache.clear()
+
+
+def make_client(handler, max_retries=3, failure_threshold=5):
+    """Create a BondClient whose shared HTTP client is served by handler."""
+    bond_client._clients[(HOST, TOKEN, TIMEOUT)] = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+    return BondClient(
+        host=HOST,
+        token=TOKEN,
+        timeout=TIMEOUT,
+        max_retries=max_retries,
+        retry_delay=0.0,
+        failure_threshold=failure_threshold
+    )
+
+
+class Handler:
+    """Mock transport handler that replays a list of responses or exceptions."""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def __call__(self, request):
+        outcome = self.outcomes[min(self.calls, len(self.outcomes) - 1)]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return httpx.Response(outcome, json={} if outcome < 400 else {"_error": "x"})
+
+
+@pytest.mark.parametrize("outcome", [httpx.ReadTimeout("read timed out"), 500, 502, 504])
+async def test_put_not_retried_after_bridge_may_have_run_it(outcome):
+    handler = Handler(outcome, 200)
+    client = make_client(handler)
+
+    with pytest.raises(BondAPIError):
+        await client.toggle_power("dev1")
+    assert handler.calls == 1
+
+
+@pytest.mark.parametrize("outcome", [httpx.ConnectError("refused"), 429, 503])
+async def test_put_retried_when_bridge_did_not_run_it(outcome):
+    handler = Handler(outcome, 200)
+    client = make_client(handler)
+
+    assert await client.toggle_power("dev1") == {}
+    assert handler.calls == 2
+
+
+@pytest.mark.parametrize("outcome", [httpx.ReadTimeout("read timed out"), 500])
+async def test_get_retried_on_transient_failure(outcome):
+    handler = Handler(outcome, 200)
+    client = make_client(handler)
+
+    assert await client.get_device_state("dev1") == {}
+    assert handler.calls == 2
+
+
+async def test_client_error_not_retried():
+    handler = Handler(401)
+    client = make_client(handler)
+
+    with pytest.raises(BondAPIError) as exc_info:
+        await client.get_device_state("dev1")
+    assert exc_info.value.status_code == 401
+    assert handler.calls == 1
+
+
+async def test_open_circuit_rejects_without_request():
+    handler = Handler(httpx.ConnectError("refused"))
+    client = make_client(handler, max_retries=0, failure_threshold=2)
+
+    for _ in range(2):
+        with pytest.raises(BondAPIError):
+            await client.get_device_state("dev1")
+    assert handler.calls == 2
+
+    with pytest.raises(BondAPIError, match="Circuit open"):
+        await client.get_device_state("dev1")
+    assert handler.calls == 2
+
+
+async def test_retries_stop_once_circuit_opens():
+    handler = Handler(httpx.ConnectError("refused"))
+    client = make_client(handler, max_retries=3)
+
+    # Another caller opens the circuit while this request is retrying
+    def open_circuit(request):
+        circuit.get_breaker(HOST).state = circuit.CircuitState.OPEN
+        return handler(request)
+
+    bond_client._clients[(HOST, TOKEN, TIMEOUT)] = httpx.AsyncClient(
+        transport=httpx.MockTransport(open_circuit)
+    )
+
+    with pytest.raises(BondAPIError, match="Circuit open"):
+        await client.get_device_state("dev1")
+    assert handler.calls == 1
@@ -0,0 +1,102 @@
+"""Tests for the Bond Bridge circuit breaker."""
+
+import pytest
+
+from bond_mcp import circuit
+from bond_mcp.circuit import CircuitBreaker, CircuitState
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the breaker's monotonic clock with a controllable one."""
+    now = [1000.0]
+    monkeypatch.setattr(circuit.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_opens_at_failure_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30.0)
+
+    breaker.on_failure()
+    breaker.on_failure()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+
+    breaker.on_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30.0)
+
+    breaker.on_failure()
+    breaker.on_success()
+    breaker.on_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_allows_single_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    breaker.on_failure()
+
+    clock[0] += 29.0
+    assert not breaker.allow_request()
+
+    clock[0] += 1.0
+    assert [breaker.allow_request() for _ in range(3)] == [True, False, False]
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.allow_retry()
+
+
+def test_half_open_trial_success_closes_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    breaker.on_failure()
+    clock[0] += 30.0
+    assert breaker.allow_request()
+
+    breaker.on_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.allow_request()
+    assert breaker.allow_request()
+
+
+def test_half_open_trial_failure_reopens_circuit(clock):
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
+    for _ in range(5):
+        breaker.on_failure()
+    clock[0] += 30.0
+    assert breaker.allow_request()
+
+    breaker.on_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert not breaker.allow_request()
+
+    clock[0] += 30.0
+    assert breaker.allow_request()
+
+
+def test_unreported_trial_expires(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    breaker.on_failure()
+    clock[0] += 30.0
+    assert breaker.allow_request()
+
+    # The trial never calls on_success/on_failure (e.g. it was cancelled)
+    clock[0] += 29.0
+    assert not breaker.allow_request()
+
+    clock[0] += 1.0
+    assert breaker.allow_request()
+    assert not breaker.allow_request()
+
+
+def test_late_failure_does_not_extend_open_window(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0)
+    breaker.on_failure()
+
+    clock[0] += 20.0
+    breaker.on_failure()
+
+    clock[0] += 10.0
+    assert breaker.allow_request()